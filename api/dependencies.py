@@ -1,13 +1,13 @@
 # api/dependencies.py
-from fastapi import Depends
+from fastapi import Depends, Request
 from domain.services.book_service import BookDomainService
 from infrastructure.repositories.in_memory_book_repository import InMemoryBookRepository
 from application.services.book_application_service import BookApplicationService
 
 # Dependency injection setup
-def get_book_repository() -> InMemoryBookRepository:
-    """Get book repository instance"""
-    return InMemoryBookRepository()
+def get_book_repository(request: Request) -> InMemoryBookRepository:
+    """Get the repository instance owned by the running application"""
+    return request.app.state.book_repository
 
 def get_book_domain_service(repository: InMemoryBookRepository = Depends(get_book_repository)) -> BookDomainService:
     """Get book domain service"""
@@ -15,4 +15,4 @@ def get_book_domain_service(repository: InMemoryBookRepository = Depends(get_boo
 
 def get_book_application_service(domain_service: BookDomainService = Depends(get_book_domain_service)) -> BookApplicationService:
     """Get book application service"""
-    return BookApplicationService(domain_service)
\ No newline at end of file
+    return BookApplicationService(domain_service)
@@ -1,71 +1,189 @@
 # main.py
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from api.endpoints.books import router as books_router
-
-# Create FastAPI application
-app = FastAPI(
-    title="Book Management System",
-    description="""
+import glob
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Precomputed OpenAPI schema, produced by scripts/export_openapi.py
+OPENAPI_SCHEMA_PATH = os.environ.get(
+    "OPENAPI_SCHEMA_PATH",
+    os.path.join(ROOT_DIR, "openapi.json")
+)
+
+# Sources that shape the OpenAPI schema: app setup, routers and DTOs
+OPENAPI_SOURCE_PATTERNS = ["main.py", "api/**/*.py", "application/dtos/**/*.py"]
+
+# Key under which scripts/export_openapi.py stores the schema fingerprint
+OPENAPI_FINGERPRINT_KEY = "x-fingerprint"
+
+APP_DESCRIPTION = """
     A comprehensive book management system built with FastAPI and Domain-Driven Design (DDD).
-    
+
     ## Features
     - **CRUD Operations**: Create, read, update, and delete books
     - **Search**: Find books by title or author
     - **Authentication**: API key-based security
     - **Validation**: Comprehensive input validation including ISBN validation
     - **DDD Architecture**: Clean separation of concerns
-    
+
     ## Authentication
     Most endpoints require an API key. Use one of these demo keys:
     - `demo-api-key-123` (demo user)
     - `admin-key-456` (admin user)
-    
+
     Include the key in the Authorization header: `Bearer your-api-key`
-    
+
     ## Architecture
     This application follows Domain-Driven Design principles:
     - **Domain Layer**: Core business logic and rules
     - **Application Layer**: Use cases and DTOs
     - **Infrastructure Layer**: Data persistence and external services
     - **API Layer**: HTTP interface and routing
-    """,
-    version="1.0.0",
-    contact={
-        "name": "Book Management API",
-        "email": "support@bookmanagement.com"
-    },
-    license_info={
-        "name": "MIT",
-    }
-)
+    """
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger(__name__)
+
+def load_openapi_schema(path: Optional[str] = None) -> Optional[dict]:
+    """
+    Load a precomputed OpenAPI schema.
+
+    Returns None if the artifact is missing or cannot be read, so the caller
+    falls back to generating the schema.
+    """
+    path = path or OPENAPI_SCHEMA_PATH
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            schema = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable OpenAPI schema %s: %s", path, e)
+        return None
+    if not isinstance(schema, dict):
+        logger.warning("Ignoring OpenAPI schema %s: not a JSON object", path)
+        return None
+    return schema
+
+def openapi_fingerprint(schema: dict) -> str:
+    """
+    Hash the schema-shaping sources together with the schema body.
+
+    Any edit to a route, DTO or the app setup, or to the exported file
+    itself, changes the fingerprint.
+    """
+    digest = hashlib.sha256()
+    for pattern in OPENAPI_SOURCE_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(ROOT_DIR, pattern), recursive=True)):
+            digest.update(os.path.relpath(path, ROOT_DIR).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    body = {key: value for key, value in schema.items() if key != OPENAPI_FINGERPRINT_KEY}
+    digest.update(json.dumps(body, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+def is_openapi_schema_current(schema: dict) -> bool:
+    """Check that a precomputed schema was exported from the current sources"""
+    return schema.get(OPENAPI_FINGERPRINT_KEY) == openapi_fingerprint(schema)
+
+def create_app(openapi_schema_path: Optional[str] = None, prebuilt_openapi: bool = True):
+    """
+    Application factory.
+
+    FastAPI, the routers and the Pydantic DTOs are imported here rather than
+    at module level, so importing this module stays cheap. If a precomputed
+    OpenAPI schema is available and matches the app it is served as-is
+    instead of being generated on the first request to /openapi.json.
+
+    Each app owns its own in-memory repository, shared by all requests to
+    that app.
+    """
+    from contextlib import asynccontextmanager
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
+    from api.endpoints.books import router as books_router
+    from infrastructure.repositories.in_memory_book_repository import InMemoryBookRepository
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Build or load the OpenAPI schema; the in-memory repository needs no warm-up"""
+        app.openapi()
+        app.state.ready = True
+        yield
+
+    # Create FastAPI application
+    app = FastAPI(
+        title="Book Management System",
+        description=APP_DESCRIPTION,
+        version="1.0.0",
+        contact={
+            "name": "Book Management API",
+            "email": "support@bookmanagement.com"
+        },
+        license_info={
+            "name": "MIT",
+        },
+        lifespan=lifespan
+    )
+    app.state.ready = False
+    app.state.book_repository = InMemoryBookRepository()
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Configure appropriately for production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include routers
+    app.include_router(books_router)
+
+    @app.get("/", tags=["root"])
+    async def root():
+        """Welcome endpoint"""
+        return {
+            "message": "Welcome to the Book Management System",
+            "documentation": "/docs",
+            "version": "1.0.0"
+        }
+
+    @app.get("/health", tags=["health"])
+    async def health_check():
+        """Health check endpoint"""
+        return {"status": "healthy"}
+
+    @app.get("/ready", tags=["health"])
+    async def readiness_check():
+        """Readiness endpoint; same as /health for the in-memory backend"""
+        if not app.state.ready:
+            return JSONResponse(status_code=503, content={"status": "warming_up"})
+        return {"status": "ready"}
 
-# Include routers
-app.include_router(books_router)
+    # Serve the prebuilt schema when it matches the app; FastAPI generates it otherwise
+    if prebuilt_openapi:
+        schema = load_openapi_schema(openapi_schema_path)
+        if schema is not None and not is_openapi_schema_current(schema):
+            logger.warning("Ignoring stale OpenAPI schema %s", openapi_schema_path or OPENAPI_SCHEMA_PATH)
+            schema = None
+        if schema is not None:
+            app.openapi = lambda: schema
 
-@app.get("/", tags=["root"])
-async def root():
-    """Welcome endpoint"""
-    return {
-        "message": "Welcome to the Book Management System",
-        "documentation": "/docs",
-        "version": "1.0.0"
-    }
+    return app
 
-@app.get("/health", tags=["health"])
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy"}
+def __getattr__(name: str):
+    """Build `main.app` lazily so `uvicorn main:app` keeps working"""
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(create_app(), host="0.0.0.0", port=8000)
@@ -0,0 +1,29 @@
+# scripts/export_openapi.py
+"""
+Write the application's OpenAPI schema to a JSON file.
+
+Run this at build time so new replicas load the schema from disk instead of
+generating it on the first request:
+
+    python scripts/export_openapi.py [output_path]
+"""
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from main import OPENAPI_FINGERPRINT_KEY, OPENAPI_SCHEMA_PATH, create_app, openapi_fingerprint
+
+def export_openapi_schema(path: str) -> None:
+    """Generate the OpenAPI schema, fingerprint it and write it to `path`"""
+    schema = dict(create_app(prebuilt_openapi=False).openapi())
+    schema[OPENAPI_FINGERPRINT_KEY] = openapi_fingerprint(schema)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(schema, f, indent=2)
+
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else OPENAPI_SCHEMA_PATH
+    export_openapi_schema(output_path)
+    print(f"OpenAPI schema written to {output_path}")
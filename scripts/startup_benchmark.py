@@ -0,0 +1,127 @@
+# scripts/startup_benchmark.py
+"""
+Measure cold-start cost of the API, with and without a prebuilt OpenAPI schema.
+
+Reports, for each mode:
+- import time of `main` and of the full app via `create_app()`
+- time from launching uvicorn until /ready answers 200
+- time of the first GET /openapi.json, first POST /books/ and first
+  GET /books/{isbn} once the server is ready
+
+Usage:
+    python scripts/startup_benchmark.py [--runs N] [--port PORT]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEADERS = {"Authorization": "Bearer demo-api-key-123"}
+
+BOOK_DATA = {
+    "title": "1984",
+    "author": "George Orwell",
+    "publication_year": 1949,
+    "isbn": "9780452284234",
+    "pages": 328
+}
+
+IMPORT_SNIPPETS = {
+    "import main": "import main",
+    "create_app()": "import main; main.create_app()",
+}
+
+def measure_import(snippet: str, env: dict) -> float:
+    """Run `snippet` in a fresh interpreter and return its wall time in seconds"""
+    code = (
+        "import time; _start = time.perf_counter(); "
+        f"{snippet}; "
+        "print(time.perf_counter() - _start)"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-W", "ignore", "-c", code], cwd=ROOT_DIR, env=env, text=True
+    )
+    return float(output.strip().splitlines()[-1])
+
+def timed(method: str, url: str, **kwargs) -> float:
+    """Send one request, check it succeeded and return its wall time in seconds"""
+    start = time.perf_counter()
+    response = requests.request(method, url, timeout=10, **kwargs)
+    elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    return elapsed
+
+def measure_server(port: int, env: dict, timeout: float = 30.0) -> dict:
+    """Start uvicorn and time readiness plus the first request to each route"""
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-W", "ignore", "-m", "uvicorn", "main:create_app", "--factory",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT_DIR,
+        env=env,
+    )
+    try:
+        while True:
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError(f"{base_url}/ready not ready after {timeout}s")
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+            try:
+                if requests.get(f"{base_url}/ready", timeout=1).status_code == 200:
+                    break
+            except requests.ConnectionError:
+                pass
+            time.sleep(0.01)
+        return {
+            "ready": time.perf_counter() - start,
+            "first GET /openapi.json": timed("GET", f"{base_url}/openapi.json"),
+            "first POST /books/": timed("POST", f"{base_url}/books/", json=BOOK_DATA, headers=HEADERS),
+            "first GET /books/{isbn}": timed(
+                "GET", f"{base_url}/books/{BOOK_DATA['isbn']}", headers=HEADERS
+            ),
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+def report(label: str, samples: list) -> None:
+    """Print median/min/max of `samples` in milliseconds"""
+    print(f"  {label:<26} median {statistics.median(samples) * 1000:8.1f} ms  "
+          f"min {min(samples) * 1000:8.1f} ms  max {max(samples) * 1000:8.1f} ms")
+
+def run_mode(label: str, schema_path: str, runs: int, port: int) -> None:
+    """Benchmark imports and a cold server with OPENAPI_SCHEMA_PATH=`schema_path`"""
+    env = dict(os.environ, OPENAPI_SCHEMA_PATH=schema_path)
+    print(label)
+    for snippet_label, snippet in IMPORT_SNIPPETS.items():
+        report(snippet_label, [measure_import(snippet, env) for _ in range(runs)])
+    server_runs = [measure_server(port, env) for _ in range(runs)]
+    for key in server_runs[0]:
+        report(key, [run[key] for run in server_runs])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts per measurement")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the benchmark server")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schema_path = os.path.join(tmp_dir, "openapi.json")
+        subprocess.check_call(
+            [sys.executable, "-W", "ignore", os.path.join("scripts", "export_openapi.py"), schema_path],
+            cwd=ROOT_DIR,
+            stdout=subprocess.DEVNULL,
+        )
+        run_mode("generated schema", os.path.join(tmp_dir, "missing.json"), args.runs, args.port)
+        run_mode("prebuilt schema", schema_path, args.runs, args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# tests/test_main.py
+import json
+import os
+import shutil
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import main
+
+HEADERS = {"Authorization": "Bearer demo-api-key-123"}
+
+BOOK_DATA = {
+    "title": "1984",
+    "author": "George Orwell",
+    "publication_year": 1949,
+    "isbn": "9780452284234",
+    "pages": 328
+}
+
+@pytest.fixture
+def missing_schema_path(tmp_path):
+    return str(tmp_path / "missing.json")
+
+@pytest.fixture
+def schema_path(tmp_path):
+    """A schema exported by scripts/export_openapi.py"""
+    path = str(tmp_path / "openapi.json")
+    subprocess.check_call(
+        [sys.executable, "-W", "ignore", os.path.join("scripts", "export_openapi.py"), path],
+        cwd=main.ROOT_DIR,
+        stdout=subprocess.DEVNULL,
+    )
+    return path
+
+def write_edited_schema(tmp_path, schema_path, edit):
+    """Copy the exported schema with `edit` applied, keeping its fingerprint"""
+    with open(schema_path, encoding="utf-8") as f:
+        schema = json.load(f)
+    edit(schema)
+    path = tmp_path / "edited.json"
+    path.write_text(json.dumps(schema), encoding="utf-8")
+    return str(path)
+
+def test_import_main_does_not_import_fastapi_or_pydantic():
+    code = "import sys, main; print(any(m.split('.')[0] in ('fastapi', 'pydantic') for m in sys.modules))"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=os.path.dirname(main.__file__), text=True)
+    assert output.strip() == "False"
+
+def test_module_app_resolves_lazily():
+    main.__dict__.pop("app", None)
+    app = main.app
+    assert isinstance(app, FastAPI)
+    assert main.app is app
+
+def test_ready_is_503_before_startup_and_200_after(missing_schema_path):
+    app = main.create_app(missing_schema_path)
+    assert TestClient(app).get("/ready").status_code == 503
+    with TestClient(app) as client:
+        response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+def test_prebuilt_schema_is_served_without_generating(schema_path):
+    with open(schema_path, encoding="utf-8") as f:
+        expected = json.load(f)
+    app = main.create_app(schema_path)
+    with mock.patch("fastapi.applications.get_openapi", side_effect=AssertionError("schema generated")):
+        with TestClient(app) as client:
+            response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert response.json() == expected
+
+def test_missing_schema_falls_back_to_generation(missing_schema_path):
+    with TestClient(main.create_app(missing_schema_path)) as client:
+        schema = client.get("/openapi.json").json()
+    assert schema["info"]["version"] == "1.0.0"
+    assert "/books/{isbn}" in schema["paths"]
+
+def test_schema_without_fingerprint_is_ignored(tmp_path, schema_path):
+    path = write_edited_schema(tmp_path, schema_path, lambda schema: schema.pop(main.OPENAPI_FINGERPRINT_KEY))
+    with TestClient(main.create_app(path)) as client:
+        assert main.OPENAPI_FINGERPRINT_KEY not in client.get("/openapi.json").json()
+
+def test_changed_operation_is_regenerated(tmp_path, schema_path):
+    path = write_edited_schema(tmp_path, schema_path, lambda schema: schema["paths"]["/books/{isbn}"].pop("delete"))
+    with TestClient(main.create_app(path)) as client:
+        assert "delete" in client.get("/openapi.json").json()["paths"]["/books/{isbn}"]
+
+def test_changed_component_is_regenerated(tmp_path, schema_path):
+    def drop_pages(schema):
+        schema["components"]["schemas"]["CreateBookRequest"]["properties"].pop("pages")
+    path = write_edited_schema(tmp_path, schema_path, drop_pages)
+    with TestClient(main.create_app(path)) as client:
+        properties = client.get("/openapi.json").json()["components"]["schemas"]["CreateBookRequest"]["properties"]
+    assert "pages" in properties
+
+def test_edited_dto_source_invalidates_schema(tmp_path, schema_path, monkeypatch):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    shutil.copy(os.path.join(main.ROOT_DIR, "main.py"), source_dir / "main.py")
+    shutil.copytree(os.path.join(main.ROOT_DIR, "api"), source_dir / "api")
+    shutil.copytree(os.path.join(main.ROOT_DIR, "application", "dtos"), source_dir / "application" / "dtos")
+    with open(schema_path, encoding="utf-8") as f:
+        schema = json.load(f)
+    monkeypatch.setattr(main, "ROOT_DIR", str(source_dir))
+    assert main.is_openapi_schema_current(schema)
+    with open(source_dir / "application" / "dtos" / "book_dtos.py", "a", encoding="utf-8") as f:
+        f.write("\nclass AddedRequest(CreateBookRequest):\n    edition: int = 1\n")
+    assert not main.is_openapi_schema_current(schema)
+
+def test_corrupt_schema_falls_back_to_generation(tmp_path):
+    path = tmp_path / "corrupt.json"
+    path.write_text("{not json", encoding="utf-8")
+    with TestClient(main.create_app(str(path))) as client:
+        assert client.get("/openapi.json").json()["info"]["version"] == "1.0.0"
+
+def test_repository_is_shared_across_requests_but_not_apps(missing_schema_path):
+    with TestClient(main.create_app(missing_schema_path)) as client:
+        assert client.post("/books/", json=BOOK_DATA, headers=HEADERS).status_code == 201
+        assert client.get("/books/9780452284234", headers=HEADERS).status_code == 200
+    with TestClient(main.create_app(missing_schema_path)) as client:
+        assert client.get("/books/9780452284234", headers=HEADERS).status_code == 404